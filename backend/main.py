@@ -1,7 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,11 +13,11 @@ app.add_middleware(
 )
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Minimal Cell Simulation API", "status": "running"}
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "healthy"}
 
 if __name__ == "__main__":